@@ -2,22 +2,43 @@
 import logging
 from typing import Callable, Optional, Any
 
+import functools
 import json
 import os
-import requests
+import ssl
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote_plus, urlencode
 
-import zope.interface
+import certifi
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from certbot.plugins.dns_common import CredentialsConfiguration
 from certbot import errors
-from certbot import interfaces
+from certbot.display import util as display_util
 from certbot.plugins import dns_common
 
 logger = logging.getLogger(__name__)
 
+# Number of response body bytes included when logging a failed API call.
+_ERROR_BODY_LIMIT = 512
+
+# Timeouts (in seconds) and retry budget for Reg.ru API calls.
+_CONNECT_TIMEOUT = 5
+_READ_TIMEOUT = 30
+_RETRIES = 4
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_BACKOFF_FACTOR = 0.5
+# Longest wait between retries, even if Reg.ru asks for more via Retry-After (urllib3's backoff maximum).
+_BACKOFF_MAX = 120
+
+# Upper bound for concurrent Reg.ru API calls; matches the HTTP connection pool size.
+_MAX_WORKERS = 4
+
 
-@zope.interface.implementer(interfaces.IAuthenticator)
-@zope.interface.provider(interfaces.IPluginFactory)
 class Authenticator(dns_common.DNSAuthenticator):
     """DNS Authenticator for Reg.ru DNS
 
@@ -29,12 +50,15 @@ class Authenticator(dns_common.DNSAuthenticator):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.credentials: Optional[CredentialsConfiguration] = None
+        self._client: Optional[_RegRuClient] = None
 
     @classmethod
     def add_parser_arguments(cls, add: Callable[..., None],
                              default_propagation_seconds: int = 120) -> None:
         super(Authenticator, cls).add_parser_arguments(add, default_propagation_seconds)
         add('credentials', help='Path to Reg.ru credentials INI file', default='/usr/local/etc/letsencrypt/regru.ini')
+        add('http2', action='store_true', default=False,
+            help='Talk to the Reg.ru API over HTTP/2 using httpx (requires the http2 extra)')
 
     def more_info(self):  # pylint: disable=missing-docstring,no-self-use
         return 'This plugin configures a DNS TXT record to respond to a dns-01 challenge using ' + \
@@ -47,12 +71,12 @@ class Authenticator(dns_common.DNSAuthenticator):
         key = credentials.conf('key')
 
         if not password or not username:
-            raise errors.PluginError('{}: Either password and username are required.'
+            raise errors.PluginError('Either password and username are required.'
                                      ' (see {})'.format(credentials.confobj.filename))
 
         if cert and key and (not os.path.exists(cert) or not os.path.exists(key)):
-            raise errors.PluginError('{}: Either cert and key not found.'
-                                     ' (see {})'.format(credentials.confobj.filename))
+            raise errors.PluginError('{}: Either cert or key not found.'
+                                     ' (see {})'.format(', '.join((cert, key)), credentials.confobj.filename))
 
     def _setup_credentials(self):
         self.credentials = self._configure_credentials(
@@ -71,8 +95,64 @@ class Authenticator(dns_common.DNSAuthenticator):
     def _cleanup(self, domain, validation_name, validation):
         self._get_regru_client().del_txt_record(validation_name, validation)
 
+    def perform(self, achalls):
+        self._setup_credentials()
+
+        self._attempt_cleanup = True
+        client = self._get_regru_client()
+        records = [(validation_name, validation) for _, validation_name, validation in self._get_records(achalls)]
+        # Records sharing a zone are published with a single Reg.ru API call per zone.
+        self._run_concurrently(client.add_txt_records_bulk, list(_group_by_zone(records).values()))
+
+        # DNS updates take time to propagate, so wait once for all of the records.
+        display_util.notify('Waiting {} seconds for DNS changes to propagate'.format(
+            self.conf('propagation-seconds')))
+        time.sleep(self.conf('propagation-seconds'))
+
+        return [achall.response(achall.account_key) for achall in achalls]
+
+    def cleanup(self, achalls):
+        try:
+            if self._attempt_cleanup:
+                self._get_regru_client()
+                self._run_concurrently(lambda record: self._cleanup(*record), self._get_records(achalls))
+        finally:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    @staticmethod
+    def _get_records(achalls):
+        """
+        Collects ``(domain, validation_name, validation)`` triples for the challenges.
+        :param list achalls: Annotated challenges.
+        :rtype: list
+        """
+        return [(achall.identifier.value,
+                 achall.validation_domain_name(achall.identifier.value),
+                 achall.validation(achall.account_key)) for achall in achalls]
+
+    @staticmethod
+    def _run_concurrently(func, items):
+        """
+        Calls ``func(item)`` for every item using a thread pool.
+        The shared Reg.ru client must be created before calling this so worker threads never race to build it.
+        :param callable func: Function to call.
+        :param list items: Items to process.
+        """
+        if not items:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(items))) as executor:
+            list(executor.map(func, items))
+
     def _get_regru_client(self):
-        return _RegRuClient(self.credentials.conf('username'), self.credentials.conf('password'), self.credentials.conf('cert'), self.credentials.conf('key'))
+        if self._client is None:
+            self._client = _RegRuClient(self.credentials.conf('username'), self.credentials.conf('password'), self.credentials.conf('cert'), self.credentials.conf('key'),
+                                        http2=self.conf('http2'))
+        return self._client
 
 
 class _RegRuClient(object):
@@ -80,15 +160,20 @@ class _RegRuClient(object):
     Encapsulates all communication with the Reg.ru
     """
 
-    def __init__(self, username, password, cert, key):
-        self.http = _HttpClient()
-        self.cert = cert
-        self.key = key
+    def __init__(self, username, password, cert=None, key=None, http2=False):
+        self._client_cert = (cert, key) if cert and key and os.path.exists(cert) and os.path.exists(key) else None
+        self.http = _HttpClient(self._client_cert, http2=http2)
         self.username = username
         self.password = password
-        self.options = {
-            'input_format': 'json',
+        # Form fields are pre-encoded so requests does not urlencode a dict on every call.
+        self._form_prefix = (urlencode({'input_format': 'json'}) + '&input_data=').encode('ascii')
+        self._base_input = {
+            'output_content_type': 'json',
+            'username': username,
+            'password': password,
         }
+        # Encoded once; _encode_params splices it after the per-call fields.
+        self._base_input_json = _dumps(self._base_input)
 
     def add_txt_record(self, record_name, record_content):
         """
@@ -102,10 +187,11 @@ class _RegRuClient(object):
 
         try:
             logger.debug('Attempting to add record: %s', data)
-            response = self.http.send('https://api.reg.ru/api/regru2/zone/add_txt', data, self.cert, self.key)
-        except requests.exceptions.RequestException as e:
-            logger.error('Encountered error adding TXT record: %d %s', e.response.status_code, e.response.text)
-            raise errors.PluginError('Error communicating with the Reg.ru API: {0}'.format(e.response.status_code))
+            response = self.http.send('https://api.reg.ru/api/regru2/zone/add_txt', data)
+        except _http_errors() as e:
+            status_code, body = _error_details(e)
+            logger.error('Encountered error adding TXT record: %s %s', status_code, body)
+            raise errors.PluginError('Error communicating with the Reg.ru API: {0}'.format(status_code))
 
         if 'result' not in response or response['result'] != 'success':
             logger.error('Encountered error adding TXT record: %s', response)
@@ -113,6 +199,40 @@ class _RegRuClient(object):
 
         logger.debug('Successfully added TXT record')
 
+    def add_txt_records_bulk(self, records):
+        """
+        Add several TXT records of one zone using a single API call.
+        Records that Reg.ru rejects are added one by one instead.
+        :param list records: ``(record_name, record_content)`` pairs, all in the same zone.
+        :raises certbot.errors.PluginError: if an error occurs communicating with the Reg.ru API
+        """
+
+        data = self._encode_params({'domains': [{
+            'dname': _split_domain(records[0][0])[1],
+            'action_list': [{
+                'action': 'add_txt',
+                'subdomain': _split_domain(record_name)[0],
+                'text': record_content,
+            } for record_name, record_content in records],
+        }]})
+
+        try:
+            logger.debug('Attempting to add records: %s', data)
+            response = self.http.send('https://api.reg.ru/api/regru2/zone/update_records', data)
+        except _http_errors() as e:
+            status_code, body = _error_details(e)
+            logger.error('Encountered error adding TXT records: %s %s', status_code, body)
+            raise errors.PluginError('Error communicating with the Reg.ru API: {0}'.format(status_code))
+
+        failed = _failed_bulk_records(response, records)
+        if failed:
+            logger.debug('Bulk update rejected %d record(s), adding them one by one: %s', len(failed), response)
+            for record_name, record_content in failed:
+                self.add_txt_record(record_name, record_content)
+            return
+
+        logger.debug('Successfully added TXT records')
+
     def del_txt_record(self, record_name, record_content):
         """
         Delete a TXT record using the supplied information.
@@ -130,9 +250,9 @@ class _RegRuClient(object):
 
         try:
             logger.debug('Attempting to delete record: %s', data)
-            response = self.http.send('https://api.reg.ru/api/regru2/zone/remove_record', data, self.cert, self.key)
-        except requests.exceptions.RequestException as e:
-            logger.warning('Encountered error deleting TXT record: %d %s', e.response.status_code, e.response.text)
+            response = self.http.send('https://api.reg.ru/api/regru2/zone/remove_record', data)
+        except _http_errors() as e:
+            logger.warning('Encountered error deleting TXT record: %s %s', *_error_details(e))
             return
 
         if 'result' not in response or response['result'] != 'success':
@@ -141,43 +261,289 @@ class _RegRuClient(object):
 
         logger.debug('Successfully deleted TXT record.')
 
+    def close(self):
+        """
+        Closes the underlying HTTP connections.
+        """
+        self.http.close()
+
     def _create_params(self, domain, input_data):
         """
         Creates POST parameters.
         :param str domain: Domain name
         :param dict input_data: Input data
-        :returns: POST parameters
-        :rtype: dict
+        :returns: Form-encoded POST body
+        :rtype: bytes
         """
-        pieces = domain.split('.')
-        input_data['subdomain'] = '.'.join(pieces[:-2])
-        input_data['domains'] = [{'dname': '.'.join(pieces[-2:])}]
-        input_data['output_content_type'] = 'json'
-        input_data['username'] = self.username
-        input_data['password'] = self.password
+        subdomain, zone = _split_domain(domain)
+        input_data['subdomain'] = subdomain
+        input_data['domains'] = [{'dname': zone}]
+
+        return self._encode_params(input_data)
+
+    def _encode_params(self, input_data):
+        """
+        Adds the account fields to the input data and encodes POST parameters.
+        :param dict input_data: Non-empty input data without any of the account fields
+        :returns: Form-encoded POST body
+        :rtype: bytes
+        """
+        # '{...}' + '{...}' -> '{...,...}', the same output as encoding the merged dict.
+        encoded = _dumps(input_data)[:-1] + ',' + self._base_input_json[1:]
+
+        return self._form_prefix + quote_plus(encoded).encode('ascii')
+
+
+# certbot imports every installed plugin at startup. requests, urllib3, json and ssl are already
+# loaded by then through certbot.plugins.dns_common; the optional orjson and httpx/h2 are not,
+# so they are imported on first use.
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """
+    Imports orjson if it is installed.
+    :returns: The orjson module or ``None``.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover
+        return None
+
+    return orjson
+
+
+def _dumps(obj):
+    """
+    Encodes an object as compact JSON, using orjson when it is installed.
+    :rtype: str
+    """
+    orjson = _orjson()
+    if orjson is None:  # pragma: no cover
+        return json.dumps(obj, separators=(',', ':'))
+    return orjson.dumps(obj).decode('utf-8')
+
+
+def _loads(data):
+    """
+    Decodes JSON, using orjson when it is installed.
+    :param bytes data: JSON document
+    :raises ValueError: if the data is not valid JSON
+    """
+    orjson = _orjson()
+    if orjson is None:  # pragma: no cover
+        return json.loads(data)
+    return orjson.loads(data)
+
 
-        data = self.options.copy()
-        data.update({'input_data': json.dumps(input_data)})
+@functools.lru_cache(maxsize=None)
+def _httpx():
+    """
+    Imports httpx if it is installed together with HTTP/2 support.
+    :returns: The httpx module or ``None``.
+    """
+    try:
+        import httpx
+        import h2  # pylint: disable=unused-import
+    except ImportError:  # pragma: no cover
+        return None
+
+    return httpx
+
+
+@functools.lru_cache(maxsize=None)
+def _http_errors():
+    """
+    Collects errors raised by :meth:`_HttpClient.send`: those of whichever HTTP library it ends up
+    using, plus :class:`_InvalidResponseError` for response bodies that are not valid JSON.
+    :rtype: tuple
+    """
+    httpx = _httpx()
+    return (requests.exceptions.RequestException, _InvalidResponseError) + ((httpx.HTTPError,) if httpx is not None else ())
+
+
+def _error_details(error):
+    """
+    Extracts the status code and the beginning of the response body from an HTTP error.
+    :param Exception error: Error raised by :class:`_HttpClient`.
+    :returns: ``(status_code, body)``; ``('n/a', '')`` if no response was received.
+    :rtype: tuple
+    """
+    response = getattr(error, 'response', None)
+    if response is None:
+        return 'n/a', ''
+    return response.status_code, response.content[:_ERROR_BODY_LIMIT].decode('utf-8', 'replace')
+
+
+def _retry_delay(response, attempt):
+    """
+    Computes how long to wait before retrying a failed call, like urllib3's ``Retry`` does.
+    :param response: Response with a retryable status code.
+    :param int attempt: Number of retries already made.
+    :returns: The ``Retry-After`` delay if the response has one, otherwise exponential backoff;
+        either way at most ``_BACKOFF_MAX`` seconds.
+    :rtype: float
+    """
+    delay = _BACKOFF_FACTOR * 2 ** attempt
+
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            delay = max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                delay = max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
-        return data
+    return min(delay, _BACKOFF_MAX)
+
+
+class _CappedRetry(Retry):
+    """
+    urllib3 ``Retry`` that waits at most ``_BACKOFF_MAX`` seconds for a ``Retry-After`` header.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super(_CappedRetry, self).get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _BACKOFF_MAX)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_domain(domain):
+    """
+    Splits a domain name into its subdomain and zone (second-level domain).
+    :param str domain: Domain name
+    :returns: ``(subdomain, zone)``; the subdomain is empty for the zone itself.
+    :rtype: tuple
+    """
+    pieces = domain.rsplit('.', 2)
+    return (pieces[0] if len(pieces) == 3 else ''), '.'.join(pieces[-2:])
+
+
+def _failed_bulk_records(response, records):
+    """
+    Finds the records a zone/update_records call did not add.
+    Reg.ru reports results at the top level, per domain and per action; where the per-domain
+    or per-action detail is missing, the top-level ``success`` is trusted.
+    :param dict response: Decoded API response for a single-domain request.
+    :param list records: ``(record_name, record_content)`` pairs, in action order.
+    :returns: The records whose result is not ``success``.
+    :rtype: list
+    :raises certbot.errors.PluginError: if the actions reported do not match the records sent
+    """
+    if response.get('result') != 'success':
+        return records
+
+    domain = ((response.get('answer') or {}).get('domains') or [{}])[0]
+    if domain.get('result', 'success') != 'success':
+        return records
+
+    actions = domain.get('action_list')
+    if actions is None:
+        return []
+    if len(actions) != len(records):
+        raise errors.PluginError('Unexpected response from the Reg.ru API: {0}'.format(response))
+
+    return [record for record, action in zip(records, actions) if action.get('result', 'success') != 'success']
+
+
+def _group_by_zone(records):
+    """
+    Groups records by the zone (second-level domain) they belong to.
+    :param list records: ``(record_name, record_content)`` pairs.
+    :returns: Records keyed by zone, in first-seen order.
+    :rtype: dict
+    """
+    zones = {}
+    for record_name, record_content in records:
+        zones.setdefault(_split_domain(record_name)[1], []).append((record_name, record_content))
+    return zones
+
+
+class _InvalidResponseError(ValueError):
+    """
+    Raised by :meth:`_HttpClient.send` when a response body is not valid JSON.
+    Keeps the response so that :func:`_error_details` can log its status code and body.
+    """
+
+    def __init__(self, response):
+        super(_InvalidResponseError, self).__init__('Response is not valid JSON: {0} {1!r}'.format(
+            response.status_code, response.content[:_ERROR_BODY_LIMIT]))
+        self.response = response
 
 
 class _HttpClient(object):
     """
     Encapsulates HTTP requests
+
+    A single session is kept for the lifetime of the client so that consecutive
+    calls reuse the same keep-alive TCP+TLS connection. With ``http2`` an httpx
+    client is used instead of :class:`requests.Session`, letting concurrent calls
+    share one multiplexed connection.
     """
 
-    def send(self, url, data, cert, key):
+    def __init__(self, cert=None, http2=False):
+        """
+        :param tuple cert: Optional ``(cert, key)`` pair of existing files used as the client certificate.
+        :param bool http2: Use httpx over HTTP/2 instead of requests.
+        :raises certbot.errors.PluginError: if HTTP/2 is requested but httpx with HTTP/2 support is not installed
+        """
+        httpx = _httpx() if http2 else None
+        if http2 and httpx is None:
+            raise errors.PluginError('HTTP/2 support requires httpx[http2]; '
+                                     'install certbot-regru-freebsd[http2] or drop --dns-regru-http2')
+
+        if httpx is not None:
+            verify = ssl.create_default_context(cafile=certifi.where())
+            if cert:
+                verify.load_cert_chain(*cert)
+
+            # httpx only retries failed connection attempts; send() retries error responses.
+            self._retry_error_responses = True
+            self.timeout = httpx.Timeout(_READ_TIMEOUT, connect=_CONNECT_TIMEOUT)
+            self._body_keyword = 'content'
+            self.session = httpx.Client(transport=httpx.HTTPTransport(
+                http2=True, verify=verify, retries=_RETRIES, limits=httpx.Limits(max_connections=_MAX_WORKERS)))
+        else:
+            retry = _CappedRetry(total=_RETRIES, backoff_factor=_BACKOFF_FACTOR, status_forcelist=_RETRY_STATUSES,
+                                 allowed_methods=['POST'], respect_retry_after_header=True)
+
+            self._retry_error_responses = False
+            self._body_keyword = 'data'
+            self.timeout = (_CONNECT_TIMEOUT, _READ_TIMEOUT)
+            self.session = requests.Session()
+            self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_WORKERS,
+                                                       max_retries=retry))
+            self.session.cert = cert
+
+    def send(self, url, data):
         """
         Sends a POST request.
         :param str url: URL for the new :class:`Request` object.
-        :param dict data: Dictionary (will be form-encoded) to send in the body of the :class:`Request`.
+        :param bytes data: Form-encoded body of the :class:`Request`.
         :raises requests.exceptions.RequestException: if an error occurs communicating with HTTP server
+        :raises httpx.HTTPError: if an error occurs communicating with HTTP server over httpx
+        :raises _InvalidResponseError: if the response body is not valid JSON
         """
-        if cert and key and os.path.exists(cert) and os.path.exists(key):
-            response = requests.post(url, data=data, cert=(cert, key))
-        else:
-            response = requests.post(url, data=data)
+        headers = {'Content-Type': 'application/x-www-form-urlencoded', 'Content-Length': str(len(data))}
+        for attempt in range(_RETRIES + 1):
+            response = self.session.post(url, headers=headers, timeout=self.timeout, **{self._body_keyword: data})
+            if (not self._retry_error_responses or response.status_code not in _RETRY_STATUSES
+                    or attempt == _RETRIES):
+                break
+            time.sleep(_retry_delay(response, attempt))
         response.raise_for_status()
 
-        return response.json()
+        try:
+            return _loads(response.content)
+        except ValueError as e:
+            raise _InvalidResponseError(response) from e
+
+    def close(self):
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        self.session.close()
@@ -1,12 +1,19 @@
-"""Tests for certbot_regru.dns."""
+"""Tests for certbot_regru_freebsd.dns."""
 
 import os
+import re
+import tempfile
+import threading
 import unittest
 
 import json
-import mock
+from unittest import mock
+from urllib.parse import urlencode
+
 import requests
 
+from acme import messages
+from certbot import achallenges
 from certbot import errors
 from certbot.plugins import dns_test_common
 from certbot.plugins.dns_test_common import DOMAIN
@@ -21,14 +28,14 @@ HTTP_ERROR = requests.exceptions.RequestException()
 class AuthenticatorTest(test_util.TempDirTestCase, dns_test_common.BaseAuthenticatorTest):
 
     def setUp(self):
-        from certbot_regru.dns import Authenticator
+        from certbot_regru_freebsd.dns import Authenticator
 
         super(AuthenticatorTest, self).setUp()
 
         path = os.path.join(self.tempdir, 'file.ini')
         dns_test_common.write({"regru_username": USERNAME, "regru_password": PASSWORD}, path)
 
-        self.config = mock.MagicMock(regru_credentials=path, regru_propagation_seconds=0)  # don't wait during tests
+        self.config = mock.MagicMock(regru_credentials=path, regru_propagation_seconds=0, regru_http2=False)  # don't wait during tests
 
         self.auth = Authenticator(self.config, "regru")
 
@@ -36,12 +43,37 @@ class AuthenticatorTest(test_util.TempDirTestCase, dns_test_common.BaseAuthentic
         # _get_regru_client | pylint: disable=protected-access
         self.auth._get_regru_client = mock.MagicMock(return_value=self.mock_client)
 
-    def test_perform(self):
+    @test_util.patch_display_util()
+    def test_perform(self, unused_mock_get_utility):
         self.auth.perform([self.achall])
 
-        expected = [mock.call.add_txt_record('_acme-challenge.' + DOMAIN, mock.ANY)]
+        expected = [mock.call.add_txt_records_bulk([('_acme-challenge.' + DOMAIN, mock.ANY)])]
         self.assertEqual(expected, self.mock_client.mock_calls)
 
+    @test_util.patch_display_util()
+    def test_perform_multiple(self, unused_mock_get_utility):
+        self.auth.perform([self.achall, self.achall])
+
+        expected = [mock.call.add_txt_records_bulk([('_acme-challenge.' + DOMAIN, mock.ANY)] * 2)]
+        self.assertEqual(expected, self.mock_client.mock_calls)
+
+    @test_util.patch_display_util()
+    def test_perform_multiple_zones(self, unused_mock_get_utility):
+        other_domain = 'example.org'
+        other_achall = achallenges.KeyAuthorizationAnnotatedChallenge(
+            challb=self.achall.challb,
+            identifier=messages.Identifier(typ=messages.IDENTIFIER_FQDN, value=other_domain),
+            account_key=self.achall.account_key)
+        # Each zone's call waits for the other one, which only succeeds if they run concurrently.
+        barrier = threading.Barrier(2, timeout=5)
+        self.mock_client.add_txt_records_bulk.side_effect = lambda records: barrier.wait()
+
+        self.auth.perform([self.achall, other_achall])
+
+        expected = [mock.call.add_txt_records_bulk([('_acme-challenge.' + DOMAIN, mock.ANY)]),
+                    mock.call.add_txt_records_bulk([('_acme-challenge.' + other_domain, mock.ANY)])]
+        self.assertCountEqual(expected, self.mock_client.mock_calls)
+
     def test_cleanup(self):
         # _attempt_cleanup | pylint: disable=protected-access
         self.auth._attempt_cleanup = True
@@ -50,6 +82,56 @@ class AuthenticatorTest(test_util.TempDirTestCase, dns_test_common.BaseAuthentic
         expected = [mock.call.del_txt_record('_acme-challenge.' + DOMAIN, mock.ANY)]
         self.assertEqual(expected, self.mock_client.mock_calls)
 
+    def test_validate_credentials_missing_password(self):
+        credentials = self._credentials(password=None)
+
+        # _validate_credentials | pylint: disable=protected-access
+        with self.assertRaisesRegex(errors.PluginError, re.escape(credentials.confobj.filename)):
+            self.auth._validate_credentials(credentials)
+
+    def test_validate_credentials_missing_key_file(self):
+        cert = os.path.join(self.tempdir, 'cert.pem')
+        open(cert, 'w').close()
+        credentials = self._credentials(cert=cert, key=os.path.join(self.tempdir, 'key.pem'))
+
+        # _validate_credentials | pylint: disable=protected-access
+        with self.assertRaisesRegex(errors.PluginError, re.escape(credentials.confobj.filename)):
+            self.auth._validate_credentials(credentials)
+
+    def test_validate_credentials_cert_and_key(self):
+        cert = os.path.join(self.tempdir, 'cert.pem')
+        key = os.path.join(self.tempdir, 'key.pem')
+        open(cert, 'w').close()
+        open(key, 'w').close()
+
+        # _validate_credentials | pylint: disable=protected-access
+        self.auth._validate_credentials(self._credentials(cert=cert, key=key))
+
+    def _credentials(self, **values):
+        values = dict({'username': USERNAME, 'password': PASSWORD, 'cert': None, 'key': None}, **values)
+
+        credentials = mock.MagicMock()
+        credentials.conf.side_effect = values.get
+        credentials.confobj.filename = os.path.join(self.tempdir, 'file.ini')
+        return credentials
+
+    def test_cleanup_closes_client(self):
+        # _client | pylint: disable=protected-access
+        self.auth._client = self.mock_client
+        self.auth.cleanup([])
+
+        self.mock_client.close.assert_called_once_with()
+        self.assertIsNone(self.auth._client)
+
+    @mock.patch('certbot_regru_freebsd.dns._RegRuClient')
+    def test_get_regru_client_is_cached(self, regru_client):
+        # _get_regru_client | pylint: disable=protected-access
+        del self.auth._get_regru_client
+        self.auth.credentials = mock.MagicMock()
+
+        self.assertIs(self.auth._get_regru_client(), self.auth._get_regru_client())
+        regru_client.assert_called_once_with(mock.ANY, mock.ANY, mock.ANY, mock.ANY, http2=False)
+
 
 class RegRuClientTest(unittest.TestCase):
 
@@ -58,48 +140,63 @@ class RegRuClientTest(unittest.TestCase):
     record_content = "test"
 
     def setUp(self):
-        from certbot_regru.dns import _RegRuClient
+        from certbot_regru_freebsd.dns import _RegRuClient
 
         self.client = _RegRuClient(USERNAME, PASSWORD)
 
         self.http = mock.MagicMock()
         self.client.http = self.http
 
+    def test_client_cert_missing_files(self):
+        from certbot_regru_freebsd.dns import _RegRuClient
+
+        client = _RegRuClient(USERNAME, PASSWORD, 'missing-cert.pem', 'missing-key.pem')
+
+        # _client_cert | pylint: disable=protected-access
+        self.assertIsNone(client._client_cert)
+        self.assertIsNone(client.http.session.cert)
+
+    def test_client_cert(self):
+        from certbot_regru_freebsd.dns import _RegRuClient
+
+        with tempfile.NamedTemporaryFile() as cert, tempfile.NamedTemporaryFile() as key:
+            client = _RegRuClient(USERNAME, PASSWORD, cert.name, key.name)
+
+        # _client_cert | pylint: disable=protected-access
+        self.assertEqual((cert.name, key.name), client._client_cert)
+        self.assertEqual((cert.name, key.name), client.http.session.cert)
+
     def test_add_txt_record(self):
         self.http.send.return_value = {'result': 'success'}
         self.client.add_txt_record(self.record_name, self.record_content)
 
-        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/add_txt', {
-            'username': USERNAME,
-            'password': PASSWORD,
-            'io_encoding': 'utf8',
-            'show_input_params': 1,
-            'output_format': 'json',
+        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/add_txt', urlencode({
             'input_format': 'json',
             'input_data': json.dumps({
                 'text': self.record_content,
                 'subdomain': self.record_prefix,
-                'domains': [{'dname': DOMAIN}]
-            })
-        })
+                'domains': [{'dname': DOMAIN}],
+                'output_content_type': 'json',
+                'username': USERNAME,
+                'password': PASSWORD
+            }, separators=(',', ':'))
+        }).encode('ascii'))
 
     def test_add_txt_record_subdomain(self):
         self.http.send.return_value = {'result': 'success'}
         self.client.add_txt_record(self.record_prefix + '.subdomain.' + DOMAIN, self.record_content)
 
-        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/add_txt', {
-            'username': USERNAME,
-            'password': PASSWORD,
-            'io_encoding': 'utf8',
-            'show_input_params': 1,
-            'output_format': 'json',
+        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/add_txt', urlencode({
             'input_format': 'json',
             'input_data': json.dumps({
                 'text': self.record_content,
                 'subdomain': self.record_prefix + '.subdomain',
-                'domains': [{'dname': DOMAIN}]
-            })
-        })
+                'domains': [{'dname': DOMAIN}],
+                'output_content_type': 'json',
+                'username': USERNAME,
+                'password': PASSWORD
+            }, separators=(',', ':'))
+        }).encode('ascii'))
 
     def test_add_txt_record_error_failed_result(self):
         self.http.send.return_value = {'result': 'failed'}
@@ -113,43 +210,112 @@ class RegRuClientTest(unittest.TestCase):
         self.http.send.side_effect = HTTP_ERROR
         self.assertRaises(errors.PluginError, self.client.add_txt_record, self.record_name, self.record_content)
 
+    def test_add_txt_record_error_non_json_body(self):
+        self._use_non_json_http()
+
+        with self.assertLogs('certbot_regru_freebsd.dns', 'ERROR') as logs:
+            self.assertRaises(errors.PluginError, self.client.add_txt_record, self.record_name, self.record_content)
+
+        self.assertIn('502 <html>502 Bad Gateway</html>', logs.output[0])
+
+    def test_add_txt_records_bulk(self):
+        self.http.send.return_value = self._bulk_response('success', 'success', 'success')
+        self.client.add_txt_records_bulk([(self.record_name, self.record_content),
+                                          (self.record_prefix + '.subdomain.' + DOMAIN, self.record_content)])
+
+        self.http.send.assert_called_once_with('https://api.reg.ru/api/regru2/zone/update_records', urlencode({
+            'input_format': 'json',
+            'input_data': json.dumps({
+                'domains': [{
+                    'dname': DOMAIN,
+                    'action_list': [
+                        {'action': 'add_txt', 'subdomain': self.record_prefix, 'text': self.record_content},
+                        {'action': 'add_txt', 'subdomain': self.record_prefix + '.subdomain',
+                         'text': self.record_content},
+                    ]
+                }],
+                'output_content_type': 'json',
+                'username': USERNAME,
+                'password': PASSWORD
+            }, separators=(',', ':'))
+        }).encode('ascii'))
+
+    def test_add_txt_records_bulk_fallback(self):
+        self.http.send.side_effect = [{'result': 'error'}, {'result': 'success'}, {'result': 'success'}]
+        self.client.add_txt_records_bulk([(self.record_name, self.record_content)] * 2)
+
+        self.assertEqual(3, self.http.send.call_count)
+        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/add_txt', mock.ANY)
+
+    def test_add_txt_records_bulk_fallback_domain_error(self):
+        self.http.send.side_effect = [{'result': 'success', 'answer': {'domains': [{'result': 'error'}]}},
+                                      {'result': 'success'}, {'result': 'success'}]
+        self.client.add_txt_records_bulk([(self.record_name, self.record_content)] * 2)
+
+        self.assertEqual(3, self.http.send.call_count)
+
+    def test_add_txt_records_bulk_fallback_action_error(self):
+        self.http.send.side_effect = [self._bulk_response('success', 'success', 'error'), {'result': 'success'}]
+        self.client.add_txt_records_bulk([(self.record_name, self.record_content),
+                                          (self.record_prefix + '.subdomain.' + DOMAIN, self.record_content)])
+
+        self.assertEqual(2, self.http.send.call_count)
+        self.assertIn(b'subdomain%22%3A%22' + self.record_prefix.encode('ascii') + b'.subdomain',
+                      self.http.send.call_args[0][1])
+
+    def test_add_txt_records_bulk_success_without_details(self):
+        for response in ({'result': 'success'},
+                         {'result': 'success', 'answer': None},
+                         {'result': 'success', 'answer': {'domains': [{'dname': DOMAIN, 'result': 'success'}]}}):
+            self.http.send.reset_mock()
+            self.http.send.return_value = response
+            self.client.add_txt_records_bulk([(self.record_name, self.record_content)] * 2)
+
+            self.http.send.assert_called_once_with('https://api.reg.ru/api/regru2/zone/update_records', mock.ANY)
+
+    def test_add_txt_records_bulk_error_action_mismatch(self):
+        self.http.send.return_value = self._bulk_response('success', 'success')
+        self.assertRaises(errors.PluginError, self.client.add_txt_records_bulk,
+                          [(self.record_name, self.record_content)] * 2)
+
+    def test_add_txt_records_bulk_error_send_request(self):
+        self.http.send.side_effect = HTTP_ERROR
+        self.assertRaises(errors.PluginError, self.client.add_txt_records_bulk,
+                          [(self.record_name, self.record_content)])
+
     def test_del_txt_record(self):
         self.http.send.return_value = {'result': 'success'}
         self.client.del_txt_record(self.record_name, self.record_content)
 
-        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/remove_record', {
-            'username': USERNAME,
-            'password': PASSWORD,
-            'io_encoding': 'utf8',
-            'show_input_params': 1,
-            'output_format': 'json',
+        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/remove_record', urlencode({
             'input_format': 'json',
             'input_data': json.dumps({
                 'record_type': 'TXT',
                 'content': self.record_content,
                 'subdomain': self.record_prefix,
-                'domains': [{'dname': DOMAIN}]
-            })
-        })
+                'domains': [{'dname': DOMAIN}],
+                'output_content_type': 'json',
+                'username': USERNAME,
+                'password': PASSWORD
+            }, separators=(',', ':'))
+        }).encode('ascii'))
 
     def test_del_txt_record_subdomain(self):
         self.http.send.return_value = {'result': 'success'}
         self.client.del_txt_record(self.record_prefix + '.subdomain.' + DOMAIN, self.record_content)
 
-        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/remove_record', {
-            'username': USERNAME,
-            'password': PASSWORD,
-            'io_encoding': 'utf8',
-            'show_input_params': 1,
-            'output_format': 'json',
+        self.http.send.assert_called_with('https://api.reg.ru/api/regru2/zone/remove_record', urlencode({
             'input_format': 'json',
             'input_data': json.dumps({
                 'record_type': 'TXT',
                 'content': self.record_content,
                 'subdomain': self.record_prefix + '.subdomain',
-                'domains': [{'dname': DOMAIN}]
-            })
-        })
+                'domains': [{'dname': DOMAIN}],
+                'output_content_type': 'json',
+                'username': USERNAME,
+                'password': PASSWORD
+            }, separators=(',', ':'))
+        }).encode('ascii'))
 
     def test_del_txt_record_error_failed_result(self):
         self.http.send.return_value = {'result': 'failed'}
@@ -163,5 +329,216 @@ class RegRuClientTest(unittest.TestCase):
         self.http.send.side_effect = HTTP_ERROR
         self.client.del_txt_record(self.record_name, self.record_content)
 
+    def test_del_txt_record_error_non_json_body(self):
+        self._use_non_json_http()
+
+        with self.assertLogs('certbot_regru_freebsd.dns', 'WARNING') as logs:
+            self.client.del_txt_record(self.record_name, self.record_content)
+
+        self.assertIn('502 <html>502 Bad Gateway</html>', logs.output[0])
+
+    @staticmethod
+    def _bulk_response(domain_result, *action_results):
+        return {'result': 'success', 'answer': {'domains': [{
+            'dname': DOMAIN,
+            'result': domain_result,
+            'action_list': [{'action': 'add_txt', 'result': result} for result in action_results],
+        }]}}
+
+    def _use_non_json_http(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        self.client.http = _HttpClient()
+        self.client.http.session = mock.MagicMock()
+        self.client.http.session.post.return_value.status_code = 502
+        self.client.http.session.post.return_value.content = b'<html>502 Bad Gateway</html>'
+
+
+class ErrorDetailsTest(unittest.TestCase):
+
+    def test_error_details_without_response(self):
+        from certbot_regru_freebsd.dns import _error_details
+
+        self.assertEqual(('n/a', ''), _error_details(HTTP_ERROR))
+
+    def test_error_details_truncates_body(self):
+        from certbot_regru_freebsd.dns import _error_details
+
+        response = mock.MagicMock(status_code=502, content=b'x' * 4096)
+        error = requests.exceptions.HTTPError(response=response)
+
+        self.assertEqual((502, 'x' * 512), _error_details(error))
+
+
+class SplitDomainTest(unittest.TestCase):
+
+    def test_split_domain(self):
+        from certbot_regru_freebsd.dns import _split_domain
+
+        self.assertEqual(('_acme-challenge.a.b', DOMAIN), _split_domain('_acme-challenge.a.b.' + DOMAIN))
+        self.assertEqual(('', DOMAIN), _split_domain(DOMAIN))
+
+
+class HttpClientTest(unittest.TestCase):
+
+    url = 'https://api.reg.ru/api/regru2/zone/add_txt'
+    body = b'input_format=json&input_data=%7B%7D'
+
+    def setUp(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        # Pin the requests code path even where httpx[http2] is installed.
+        patcher = mock.patch('certbot_regru_freebsd.dns._httpx', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = _HttpClient()
+
+        self.session = mock.MagicMock()
+        self.client.session = self.session
+
+    def test_send_reuses_session(self):
+        self.session.post.return_value.content = b'{"result":"success"}'
+
+        self.assertEqual({'result': 'success'}, self.client.send(self.url, self.body))
+        self.assertEqual({'result': 'success'}, self.client.send(self.url, self.body))
+
+        self.assertEqual(2, self.session.post.call_count)
+        self.session.post.assert_called_with(self.url, headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Content-Length': str(len(self.body)),
+        }, timeout=self.client.timeout, data=self.body)
+
+    def test_retry_config(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        retry = _HttpClient().session.get_adapter('https://api.reg.ru/').max_retries
+
+        self.assertEqual(4, retry.total)
+        self.assertEqual(0.5, retry.backoff_factor)
+        self.assertEqual({429, 500, 502, 503, 504}, set(retry.status_forcelist))
+        self.assertEqual({'POST'}, set(retry.allowed_methods))
+        self.assertTrue(retry.respect_retry_after_header)
+
+    def test_retry_after_is_capped(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        retry = _HttpClient().session.get_adapter('https://api.reg.ru/').max_retries
+
+        self.assertEqual(120, retry.get_retry_after(mock.MagicMock(headers={'Retry-After': '86400'})))
+        self.assertEqual(2, retry.get_retry_after(mock.MagicMock(headers={'Retry-After': '2'})))
+        self.assertEqual(120, retry.new(total=1).get_retry_after(mock.MagicMock(headers={'Retry-After': '86400'})))
+
+    def test_send_non_json_body(self):
+        from certbot_regru_freebsd.dns import _InvalidResponseError
+
+        self.session.post.return_value.status_code = 200
+        self.session.post.return_value.content = b'<html>' + b'x' * 4096
+
+        with self.assertRaises(_InvalidResponseError) as context:
+            self.client.send(self.url, self.body)
+
+        self.assertIs(self.session.post.return_value, context.exception.response)
+        self.assertIn("200 b'<html>x", str(context.exception))
+        self.assertLess(len(str(context.exception)), 600)
+
+    def test_close(self):
+        self.client.close()
+
+        self.session.close.assert_called_once_with()
+
+
+class HttpxClientTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('certbot_regru_freebsd.dns._httpx')
+        self.httpx = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_requests_by_default(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        client = _HttpClient()
+
+        self.assertIsInstance(client.session, requests.Session)
+        self.httpx.Client.assert_not_called()
+
+    @mock.patch('ssl.create_default_context')
+    def test_http2(self, create_default_context):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        client = _HttpClient(('cert.pem', 'key.pem'), http2=True)
+
+        create_default_context.return_value.load_cert_chain.assert_called_once_with('cert.pem', 'key.pem')
+        self.httpx.HTTPTransport.assert_called_once_with(
+            http2=True, verify=create_default_context.return_value, retries=mock.ANY, limits=mock.ANY)
+        self.assertIs(self.httpx.Client.return_value, client.session)
+
+    @mock.patch('ssl.create_default_context')
+    def test_http2_sends_content(self, unused_create_default_context):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        body = b'input_format=json&input_data=%7B%7D'
+        client = _HttpClient(http2=True)
+        client.session = mock.MagicMock()
+        client.session.post.return_value = mock.MagicMock(status_code=200, content=b'{"result":"success"}')
+
+        self.assertEqual({'result': 'success'}, client.send('https://api.reg.ru/', body))
+        client.session.post.assert_called_once_with('https://api.reg.ru/', headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Content-Length': str(len(body)),
+        }, timeout=client.timeout, content=body)
+
+    @mock.patch('time.sleep')
+    @mock.patch('ssl.create_default_context')
+    def test_http2_retries_error_status(self, unused_create_default_context, sleep):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        client = _HttpClient(http2=True)
+        client.session = mock.MagicMock()
+        client.session.post.side_effect = [
+            mock.MagicMock(status_code=503, headers={'Retry-After': '2'}),
+            mock.MagicMock(status_code=502, headers={}),
+            mock.MagicMock(status_code=200, headers={}, content=b'{"result":"success"}'),
+        ]
+
+        self.assertEqual({'result': 'success'}, client.send('https://api.reg.ru/', b''))
+        self.assertEqual([mock.call(2.0), mock.call(1.0)], sleep.call_args_list)
+
+    @mock.patch('time.sleep')
+    @mock.patch('ssl.create_default_context')
+    def test_http2_retries_exhausted(self, unused_create_default_context, sleep):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        client = _HttpClient(http2=True)
+        client.session = mock.MagicMock()
+        client.session.post.return_value = mock.MagicMock(status_code=503, headers={})
+        client.session.post.return_value.raise_for_status.side_effect = HTTP_ERROR
+
+        self.assertRaises(requests.exceptions.RequestException, client.send, 'https://api.reg.ru/', b'')
+        self.assertEqual(5, client.session.post.call_count)
+        self.assertEqual(4, sleep.call_count)
+
+    @mock.patch('time.sleep')
+    @mock.patch('ssl.create_default_context')
+    def test_http2_retry_after_is_capped(self, unused_create_default_context, sleep):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        client = _HttpClient(http2=True)
+        client.session = mock.MagicMock()
+        client.session.post.side_effect = [
+            mock.MagicMock(status_code=429, headers={'Retry-After': '86400'}),
+            mock.MagicMock(status_code=200, headers={}, content=b'{"result":"success"}'),
+        ]
+
+        client.send('https://api.reg.ru/', b'')
+        sleep.assert_called_once_with(120)
+
+    def test_http2_not_installed(self):
+        from certbot_regru_freebsd.dns import _HttpClient
+
+        with mock.patch('certbot_regru_freebsd.dns._httpx', return_value=None):
+            self.assertRaises(errors.PluginError, _HttpClient, http2=True)
+
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
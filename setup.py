@@ -4,14 +4,16 @@ from setuptools import find_packages
 from certbot_regru_freebsd import __version__
 
 install_requires = [
-    'acme>=4.1.1',
-    'certbot>=4.1.1',
+    'acme>=5.3.0',
+    'certbot>=5.3.0',
     'requests>=2.30.0',
-    'mock',
-    'setuptools',
-    'zope.interface',
 ]
 
+extras_require = {
+    'fast': ['orjson'],
+    'http2': ['httpx[http2]'],
+}
+
 data_files = [
     ('/usr/local/etc/letsencrypt', ['regru.ini'])
 ]
@@ -29,7 +31,7 @@ setup(
     author="Honyrik",
     author_email='honyrik@gmail.com',
     license='MIT',
-    python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*',
+    python_requires='>=3.10',
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Environment :: Plugins',
@@ -37,12 +39,13 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: POSIX :: Linux',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
+        'Programming Language :: Python :: 3.13',
+        'Programming Language :: Python :: 3.14',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Security',
         'Topic :: System :: Installation/Setup',
@@ -51,6 +54,7 @@ setup(
         'Topic :: Utilities',
     ],
     install_requires=install_requires,
+    extras_require=extras_require,
     data_files=data_files,
     packages=find_packages(),
     include_package_data=True,